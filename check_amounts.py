@@ -3,44 +3,85 @@
 Check mail amounts for divisibility by ticket cost
 """
 
+import itertools
 import re
 import sys
 import io
 
-# Fix Windows console encoding issues
-if sys.platform == "win32":
-    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
-    sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8')
+TICKET_COST_KEY = b'["ticket_cost"]'
+TICKET_COST_RE = re.compile(rb'\["ticket_cost"\]\s*=\s*(\d+)')
+AMOUNT_RE = re.compile(rb'\["amount"\]\s*=\s*(\d+)')
+MAX_INVALID_SAMPLES = 5
+READ_BLOCK_SIZE = 1 << 20  # 1 MB
+
+def _iter_blocks(f):
+    """Yield the file in blocks of whole lines, so no match is split between two blocks"""
+    carry = b""
+    while True:
+        block = f.read(READ_BLOCK_SIZE)
+        if not block:
+            if carry:
+                yield carry
+            return
+        block = carry + block
+        cut = block.rfind(b"\n") + 1
+        carry = block[cut:]
+        if cut:
+            yield block[:cut]
+
+def _find_ticket_cost(blocks):
+    """Consume blocks up to the first ticket_cost, returning it and the amounts in the blocks read"""
+    amounts_seen = []
+    for block in blocks:
+        amounts_seen.extend(AMOUNT_RE.findall(block))
+        # Locate the key with a literal find, then only parse the value at that spot
+        idx = block.find(TICKET_COST_KEY)
+        while idx >= 0:
+            match = TICKET_COST_RE.match(block, idx)
+            if match:
+                return int(match.group(1)), amounts_seen
+            idx = block.find(TICKET_COST_KEY, idx + 1)
+    return None, amounts_seen
+
+def _tally_amounts(amount_batches, ticket_cost):
+    """Count amounts and valid amounts one batch at a time, keeping a few invalid samples"""
+    total = 0
+    valid_count = 0
+    invalid_samples = []
+    for batch in amount_batches:
+        amounts = list(map(int, batch))
+        invalid = [amount for amount in amounts if amount % ticket_cost]
+        total += len(amounts)
+        valid_count += len(amounts) - len(invalid)
+        if len(invalid_samples) < MAX_INVALID_SAMPLES:
+            invalid_samples.extend((amount, amount % ticket_cost)
+                                   for amount in invalid[:MAX_INVALID_SAMPLES - len(invalid_samples)])
+    return total, valid_count, invalid_samples
 
 def check_amounts(filename):
     """Check what percentage of mail amounts are divisible by ticket cost"""
     
-    with open(filename, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
-    # Extract ticket cost (assuming it's consistent)
-    ticket_cost_match = re.search(r'\["ticket_cost"\]\s*=\s*(\d+)', content)
-    if not ticket_cost_match:
-        print("Could not find ticket_cost in file")
-        return
+    # Stream the file in blocks instead of reading it into memory
+    with open(filename, 'rb') as f:
+        blocks = _iter_blocks(f)
+        
+        # Extract ticket cost (assuming it's consistent)
+        ticket_cost, amounts_seen = _find_ticket_cost(blocks)
+        if ticket_cost is None:
+            print("Could not find ticket_cost in file")
+            return
+        
+        print(f"Ticket cost: {ticket_cost}")
+        
+        # Tally the remaining mail amounts in the same pass over the file
+        total, valid_count, invalid_samples = _tally_amounts(
+            itertools.chain((amounts_seen,), map(AMOUNT_RE.findall, blocks)), ticket_cost)
     
-    ticket_cost = int(ticket_cost_match.group(1))
-    print(f"Ticket cost: {ticket_cost}")
-    
-    # Find all mail amounts
-    amount_pattern = r'\["amount"\]\s*=\s*(\d+)'
-    amounts = [int(match) for match in re.findall(amount_pattern, content)]
-    
-    if not amounts:
+    if not total:
         print("No mail amounts found")
         return
     
-    valid_amounts = [amount for amount in amounts if amount % ticket_cost == 0]
-    invalid_amounts = [amount for amount in amounts if amount % ticket_cost != 0]
-    
-    total = len(amounts)
-    valid_count = len(valid_amounts)
-    invalid_count = len(invalid_amounts)
+    invalid_count = total - valid_count
     
     print(f"\nTotal mail entries: {total}")
     print(f"Valid amounts (divisible by {ticket_cost}): {valid_count} ({valid_count/total*100:.1f}%)")
@@ -48,11 +89,15 @@ def check_amounts(filename):
     
     if invalid_count > 0:
         print(f"\nSample invalid amounts:")
-        for amount in invalid_amounts[:5]:
-            remainder = amount % ticket_cost
+        for amount, remainder in invalid_samples:
             print(f"  {amount} (remainder: {remainder})")
 
 if __name__ == "__main__":
+    # Fix Windows console encoding issues (only when run as a script, the GUI imports this module)
+    if sys.platform == "win32":
+        sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+        sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8')
+    
     if len(sys.argv) != 2:
         print("Usage: python check_amounts.py <filename.lua>")
         sys.exit(1)
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Check that the direct account emitters write the same Lua as format_lua_value
+"""
+
+import io
+import sys
+
+from generate_raffle_data import (RaffleDataGenerator, _indent, _lua_string,
+                                  _MAIL_TEMPLATE_FIELDS, _QUOTED_TEMPLATES)
+
+ACCOUNT_TYPES = ('blank', 'roster', 'mail', 'mixed')
+USERNAME = "@CheckAccount"
+BASE_TIMESTAMP = 1753000000
+
+def _template_fields(account):
+    """Return the body/subject fields the emitters would write for a generated account dict"""
+    data = account["$AccountWide"]
+    if "body" not in data:
+        return b""
+    return _MAIL_TEMPLATE_FIELDS % (_QUOTED_TEMPLATES[data["body"]], _QUOTED_TEMPLATES[data["subject"]])
+
+def _dict_path(account_type, seed, ticket_cost, roster_entries, mail_entries):
+    """Build the account dict and write it with format_lua_value, as an entry of the Default table"""
+    generator = RaffleDataGenerator(BASE_TIMESTAMP, seed)
+    if account_type == 'blank':
+        account = generator.generate_blank_account(ticket_cost)
+    elif account_type == 'roster':
+        account = generator.generate_roster_account(ticket_cost, roster_entries)
+    elif account_type == 'mail':
+        account = generator.generate_mail_account(ticket_cost, mail_entries)
+    else:
+        account = generator.generate_mixed_account(ticket_cost, roster_entries, mail_entries)
+
+    out = io.BytesIO()
+    out.write(b"%s[%s] = " % (_indent(2), _lua_string(USERNAME)))
+    generator.format_lua_value(account, out, 2)
+    out.write(b",\n")
+    return out.getvalue(), _template_fields(account)
+
+def _emitter_path(account_type, seed, ticket_cost, roster_entries, mail_entries, templates):
+    """Write the same account with the matching _emit_*_account method"""
+    generator = RaffleDataGenerator(BASE_TIMESTAMP, seed)
+    out = io.BytesIO()
+    if account_type == 'blank':
+        generator._emit_blank_account(USERNAME, ticket_cost, out)
+    elif account_type == 'roster':
+        generator._emit_roster_account(USERNAME, ticket_cost, roster_entries, out)
+    elif account_type == 'mail':
+        generator._emit_mail_account(USERNAME, ticket_cost, mail_entries, templates, out)
+    else:
+        generator._emit_mixed_account(USERNAME, ticket_cost, roster_entries, mail_entries, templates, out)
+    return out.getvalue()
+
+def check_emitters(seeds=range(20), ticket_cost=1000, roster_entries=5, mail_entries=5):
+    """Compare both serializers for every account type and seed, returning True if they all match"""
+    mismatches = 0
+    for account_type in ACCOUNT_TYPES:
+        for seed in seeds:
+            # The emitters get their templates pre-drawn, so they are taken from the dict
+            expected, templates = _dict_path(account_type, seed, ticket_cost, roster_entries, mail_entries)
+            actual = _emitter_path(account_type, seed, ticket_cost, roster_entries, mail_entries, templates)
+            if actual != expected:
+                mismatches += 1
+                print(f"Mismatch for a {account_type} account with seed {seed}")
+
+    if mismatches:
+        print(f"Found {mismatches} mismatches between the emitters and format_lua_value")
+        return False
+    print("[SUCCESS] The emitters match format_lua_value for every account type")
+    return True
+
+if __name__ == "__main__":
+    sys.exit(0 if check_emitters() else 1)
@@ -18,15 +18,21 @@ RaffleManager Data GeneratoDEFAULT_CONFIG = {
 """
 
 import argparse
+import collections
+import copy
 import random
 import time
 import os
 import json
 import datetime
-from typing import List, Dict, Any, Optional
+import functools
+import io
+import itertools
+import multiprocessing
+from typing import List, Dict, Set, Any, Optional, BinaryIO, Callable, Tuple, Iterator
 
 # Word lists for generating realistic but generic usernames (similar to Docker container names)
-ADJECTIVES = [
+ADJECTIVES = (
     "active", "ancient", "bold", "brave", "calm", "clever", "cool", "curious",
     "daring", "eager", "epic", "fast", "gentle", "happy", "keen", "lucky",
     "mighty", "noble", "proud", "quick", "royal", "silent", "swift", "wise",
@@ -34,9 +40,9 @@ ADJECTIVES = [
     "humble", "iron", "jovial", "kind", "lunar", "magic", "nimble", "ocean",
     "plasma", "quantum", "radiant", "stellar", "thunder", "ultra", "vibrant",
     "wild", "xenial", "yellow", "zesty"
-]
+)
 
-NOUNS = [
+NOUNS = (
     "archer", "baker", "crafter", "dancer", "explorer", "fighter", "guardian",
     "hunter", "knight", "mage", "navigator", "oracle", "paladin", "ranger",
     "scholar", "trader", "warrior", "wizard", "alchemist", "bard", "cleric",
@@ -45,27 +51,169 @@ NOUNS = [
     "protector", "questor", "runner", "seeker", "templar", "voyager", "weaver",
     "crystal", "phoenix", "dragon", "storm", "shadow", "flame", "frost",
     "thunder", "lightning", "mystic"
-]
+)
 
-RANKS = ["Recruit", "Member", "Veteran", "Officer", "Guild Master"]
+# Title-cased once so usernames don't re-title the words on every draw
+ADJ_T = tuple(adjective.title() for adjective in ADJECTIVES)
+NOUN_T = tuple(noun.title() for noun in NOUNS)
 
-MAIL_SUBJECTS = [
+# 70% of usernames have no number suffix, the rest get 1-999
+USERNAME_SUFFIXES = ("",) + tuple(str(number) for number in range(1, 1000))
+USERNAME_SUFFIX_CUM_WEIGHTS = [0.7] + [0.7 + 0.3 * number / 999 for number in range(1, 1000)]
+
+# Rejection sampling only stays cheap while the username space is sparsely used; past
+# this many names, the rest get a serial suffix (1000 and up) that can't collide
+USERNAME_CAPACITY = len(ADJ_T) * len(NOUN_T) * len(USERNAME_SUFFIXES)
+USERNAME_SAMPLING_LIMIT = int(USERNAME_CAPACITY * 0.3)
+
+RANKS = ("Recruit", "Member", "Veteran", "Officer", "Guild Master")
+
+MAIL_SUBJECTS = (
     "tix", "tickets", "raffle", "raffle tickets", "weekly raffle",
     "raffle entry", "BBC raffle", "guild raffle", "raffle tix",
     "tickets please", "raffle please", "", "Gold", "entry fee"
-]
+)
 
-MAIL_BODY_TEMPLATES = [
+MAIL_BODY_TEMPLATES = (
     "Hello, <<1>>!\r\n\r\nConfirming your purchase for the Guild Raffle!\r \n\r\nNumber of Tickets Purchased:|cFFD000    <<2>>|r\r\n\r\nAdditional tickets can be purchased until Tuesday Night.\r\n\r\nDrawings are held weekly.",
     "Welcome to the raffle, <<1>>!\r\n\r\nTickets purchased: <<2>>\r\n\r\nGood luck in this week's drawing!",
     "Raffle confirmation for <<1>>\r\n\r\nTickets: <<2>>\r\n\r\nThank you for participating!"
-]
+)
 
-MAIL_SUBJECTS_TEMPLATES = [
+MAIL_SUBJECTS_TEMPLATES = (
     ":: |cF5FC24Guild Raffle Receipt|r ::",
     "Raffle Ticket Confirmation",
     "Weekly Raffle Entry Confirmed"
-]
+)
+
+# Fixed-schema records for roster and mail entries, serialized by the specialized emitters
+RosterRec = collections.namedtuple('RosterRec', 'account joined sales10 purchases30 sales30 rank purchases10')
+MailRec = collections.namedtuple('MailRec', 'subject id amount user')
+
+# Mail IDs are drawn without replacement from this range
+MAIL_ID_RANGE = range(2700000000, 3000000000)
+
+# Bulk integer draws use getrandbits(FAST_RAND_BITS) % span instead of randint;
+# the modulo bias (under span / 2**40) is irrelevant for test data
+FAST_RAND_BITS = 40
+
+# Output files are written through a 1 MB buffer
+WRITE_BUFFER_SIZE = 1 << 20
+
+# Files with at least this many accounts + entries are generated across processes
+PARALLEL_MIN_RECORDS = 100000
+
+# Accounts are split into chunks of about this many accounts + entries; the split doesn't
+# depend on the CPU count, so a seed gives the same file serially or on any number of workers
+CHUNK_RECORDS = 20000
+
+# A slice of one file's accounts (blank, roster, mail, mixed counts) with its reserved usernames/mail IDs
+AccountChunk = collections.namedtuple(
+    'AccountChunk',
+    'base_timestamp seed counts usernames mail_ids ticket_cost roster_entries mail_entries')
+
+# Indentation for each nesting level, grown on demand
+_INDENTS = [b""]
+
+def _indent(level: int) -> bytes:
+    """Return the (cached) indentation for a nesting level"""
+    while len(_INDENTS) <= level:
+        _INDENTS.append(b"    " * len(_INDENTS))
+    return _INDENTS[level]
+
+# Characters that must be backslash-escaped inside a Lua string literal; mail body
+# templates contain line breaks, which must not appear raw inside the quotes
+_LUA_ESCAPE = str.maketrans({'"': '\\"', '\\': '\\\\', '\n': '\\n', '\r': '\\r'})
+
+def _lua_string(value: str) -> bytes:
+    """Quote a Python string as an encoded Lua string literal"""
+    # isprintable() is False for any line break, so those strings take the translate path
+    if value.isprintable() and '"' not in value and '\\' not in value:
+        return b'"' + value.encode('utf-8') + b'"'
+    return b'"' + value.translate(_LUA_ESCAPE).encode('utf-8') + b'"'
+
+# Mail body/subject templates are shared by many accounts, so quote them once
+_QUOTED_TEMPLATES = {template: _lua_string(template)
+                     for template in MAIL_BODY_TEMPLATES + MAIL_SUBJECTS_TEMPLATES}
+
+def _write_empty_table(value: Any, out: BinaryIO) -> None:
+    """Write an empty dict or list as an empty Lua table"""
+    out.write(b"{}")
+
+def _write_str(value: str, out: BinaryIO) -> None:
+    """Write a string as a quoted Lua string, reusing the pre-quoted mail templates"""
+    quoted = _QUOTED_TEMPLATES.get(value)
+    out.write(quoted if quoted is not None else _lua_string(value))
+
+def _write_number(value: Any, out: BinaryIO) -> None:
+    """Write an int or float as a Lua number"""
+    out.write(str(value).encode('ascii'))
+
+def _write_bool(value: bool, out: BinaryIO) -> None:
+    """Write a boolean as a Lua true/false"""
+    out.write(b"true" if value else b"false")
+
+def _write_other(value: Any, out: BinaryIO) -> None:
+    """Write any other value as its str() form"""
+    out.write(str(value).encode('utf-8'))
+
+# Scalar writers keyed by exact type; bool gets its own entry, so it's never written as an int
+_SCALAR_WRITERS: Dict[type, Callable[[Any, BinaryIO], None]] = {
+    str: _write_str,
+    int: _write_number,
+    float: _write_number,
+    bool: _write_bool,
+    dict: _write_empty_table,
+    list: _write_empty_table,
+}
+
+def _scalar_writer_for(value: Any) -> Callable[[Any, BinaryIO], None]:
+    """Pick a scalar writer for a subclass of one of the dispatched types"""
+    if isinstance(value, (dict, list)):
+        return _write_empty_table
+    if isinstance(value, str):
+        return _write_str
+    if isinstance(value, bool):
+        return _write_bool
+    if isinstance(value, (int, float)):
+        return _write_number
+    return _write_other
+
+def _table_fields(value: Any) -> Iterator[Tuple[Any, bytes, Any]]:
+    """Yield (key, encoded Lua key, value) for each field of a dict or list"""
+    if isinstance(value, dict):
+        for key, val in value.items():
+            if isinstance(key, str):
+                yield key, b"[" + _lua_string(key) + b"]", val
+            else:
+                yield key, b"[" + str(key).encode('utf-8') + b"]", val
+    else:
+        for i, item in enumerate(value, 1):
+            yield i, b"[%d]" % i, item
+
+# Field names and value formats for the specialized roster/mail emitters
+_ROSTER_ENTRY_FIELDS = ((b"account", b"%s"), (b"joined", b"%d"), (b"sales10", b"%d"),
+                        (b"purchases30", b"%d"), (b"sales30", b"%d"), (b"rank", b"%s"),
+                        (b"purchases10", b"%d"))
+_MAIL_ENTRY_FIELDS = ((b"subject", b"%s"), (b"id", b"%s"), (b"amount", b"%d"), (b"user", b"%s"))
+
+@functools.lru_cache(maxsize=None)
+def _entry_layout(fields: Tuple[Tuple[bytes, bytes], ...], indent: int) -> bytes:
+    """Build (once per indent) the %-format layout of a Lua table with the given fields"""
+    inner = _indent(indent + 1)
+    lines = b"".join(b'%s["%s"] = %s,\n' % (inner, name, value_format) for name, value_format in fields)
+    return b"{\n" + lines + _indent(indent) + b"}"
+
+# Fixed parts of one account written straight into the Default table (indent level 2),
+# laid out exactly as format_lua_value would write the generate_*_account dicts
+_ACCOUNT_HEAD = (b'%s[%%s] = {\n%s["$AccountWide"] = {\n%s["version"] = 1,\n%s["ticket_cost"] = %%d,\n'
+                 % (_indent(2), _indent(3), _indent(4), _indent(4)))
+_ACCOUNT_TAIL = _indent(3) + b"},\n" + _indent(2) + b"},\n"
+_ROSTER_DATA_KEY = _indent(4) + b'["roster_data"] = '
+_ROSTER_TIMESTAMP_FIELD = _indent(4) + b'["roster_timestamp"] = %d,\n'
+_MAIL_DATA_KEY = _indent(4) + b'["mail_data"] = '
+_MAIL_TIMESTAMP_FIELD = _indent(4) + b'["timestamp"] = %d,\n'
+_MAIL_TEMPLATE_FIELDS = _indent(4) + b'["body"] = %s,\n' + _indent(4) + b'["subject"] = %s,\n'
 
 # Default configuration
 DEFAULT_CONFIG = {
@@ -140,50 +288,98 @@ def timestamp_config_to_unix(timestamp_config: Dict[str, int]) -> int:
         return int(dt.timestamp())
 
 class RaffleDataGenerator:
-    def __init__(self, base_timestamp: Optional[int] = None):
-        self.used_usernames = set()
-        self.used_mail_ids = set()
+    def __init__(self, base_timestamp: Optional[int] = None, seed: Optional[int] = None):
+        self.used_usernames: Dict[str, None] = {}  # dict used as an insertion-ordered set
+        self._usernames = iter(())
+        self._username_serials = itertools.count(1000)
+        self._mail_ids = iter(())
+        self.used_mail_ids: Set[int] = set()  # Every mail ID handed out, so fallback draws stay unique
+        self._entry_emitters = {
+            RosterRec: self._emit_roster_entry,
+            MailRec: self._emit_mail_entry
+        }
         self.base_timestamp = base_timestamp if base_timestamp is not None else int(time.time())
+        self._rand = random.Random(seed)  # Own stream, so a seed makes the output reproducible
+        self._rand_bits = self._rand.getrandbits
         
-    def generate_username(self) -> str:
-        """Generate a unique username using adjective + noun pattern"""
+    def generate_usernames_batch(self, count: int) -> List[str]:
+        """Draw count new unique usernames in batches, retrying only the shortfall"""
+        choices = self._rand.choices
+        usernames = []
+        sampled = min(count, max(0, USERNAME_SAMPLING_LIMIT - len(self.used_usernames)))
         attempts = 0
-        while attempts < 100:
-            adjective = random.choice(ADJECTIVES)
-            noun = random.choice(NOUNS)
-            
-            # Add some variation
-            if random.random() < 0.3:
-                number = random.randint(1, 999)
-                username = f"@{adjective.title()}{noun.title()}{number}"
-            else:
-                username = f"@{adjective.title()}{noun.title()}"
-            
-            if username not in self.used_usernames:
-                self.used_usernames.add(username)
-                return username
+        while len(usernames) < sampled and attempts < 100:
+            # Over-draw a little so most batches cover the collisions
+            batch_size = int((sampled - len(usernames)) * 1.2) + 1
+            candidates = zip(choices(ADJ_T, k=batch_size),
+                             choices(NOUN_T, k=batch_size),
+                             choices(USERNAME_SUFFIXES, cum_weights=USERNAME_SUFFIX_CUM_WEIGHTS,
+                                     k=batch_size))
+            fresh = dict.fromkeys(f"@{adjective}{noun}{suffix}" for adjective, noun, suffix in candidates)
+            fresh = [name for name in fresh if name not in self.used_usernames][:sampled - len(usernames)]
+            self.used_usernames.update(dict.fromkeys(fresh))
+            usernames.extend(fresh)
             attempts += 1
         
-        # Fallback with timestamp if we can't find unique name
-        timestamp = str(int(time.time()))[-6:]
-        username = f"@{random.choice(ADJECTIVES).title()}{timestamp}"
-        self.used_usernames.add(username)
+        # Anything sampling didn't cover gets a serial suffix instead of more retries
+        shortfall = count - len(usernames)
+        serial = [f"@{adjective}{noun}{number}" for adjective, noun, number in
+                  zip(choices(ADJ_T, k=shortfall), choices(NOUN_T, k=shortfall),
+                      self._username_serials)]
+        self.used_usernames.update(dict.fromkeys(serial))
+        usernames.extend(serial)
+        return usernames
+    
+    def generate_username(self) -> str:
+        """Generate a unique username using adjective + noun pattern"""
+        username = next(self._usernames, None)
+        if username is None:
+            username = self.generate_usernames_batch(1)[0]
         return username
     
+    def _take_usernames(self, count: int) -> List[str]:
+        """Take count usernames from the reserve at once, generating any shortfall"""
+        usernames = list(itertools.islice(self._usernames, count))
+        usernames.extend(self.generate_username() for _ in range(count - len(usernames)))
+        return usernames
+    
     def generate_timestamp_near_base(self, max_offset_days: int = 30) -> int:
         """Generate a timestamp near the base timestamp (within max_offset_days)"""
         max_offset_seconds = max_offset_days * 24 * 60 * 60
-        offset = random.randint(-max_offset_seconds, max_offset_seconds)
+        offset = self._rand.randint(-max_offset_seconds, max_offset_seconds)
         return max(0, self.base_timestamp + offset)
     
+    def generate_timestamps_near_base(self, count: int, max_offset_days: int = 30) -> List[int]:
+        """Generate count timestamps near the base timestamp in one column draw"""
+        max_offset_seconds = max_offset_days * 24 * 60 * 60
+        span = 2 * max_offset_seconds + 1
+        low = self.base_timestamp - max_offset_seconds
+        bits = self._rand_bits
+        return [max(0, low + bits(FAST_RAND_BITS) % span) for _ in range(count)]
+    
     def generate_mail_id(self) -> str:
         """Generate a unique mail ID"""
+        mail_id = next(self._mail_ids, None)
+        if mail_id is None:
+            return str(self._draw_unused_mail_id())
+        self.used_mail_ids.add(mail_id)
+        return str(mail_id)
+    
+    def _draw_unused_mail_id(self) -> int:
+        """Draw a mail ID that hasn't been handed out yet (used once the reserve is empty)"""
         while True:
-            mail_id = str(random.randint(2700000000, 2999999999))
+            mail_id = self._rand.choice(MAIL_ID_RANGE)
             if mail_id not in self.used_mail_ids:
                 self.used_mail_ids.add(mail_id)
                 return mail_id
     
+    def _take_mail_ids(self, count: int) -> List[str]:
+        """Take count mail IDs from the reserve at once, drawing any shortfall"""
+        mail_ids = list(itertools.islice(self._mail_ids, count))
+        self.used_mail_ids.update(mail_ids)
+        mail_ids.extend(self._draw_unused_mail_id() for _ in range(count - len(mail_ids)))
+        return list(map(str, mail_ids))
+    
     def generate_blank_account(self, ticket_cost: int = 1000) -> Dict[str, Any]:
         """Generate a blank account with minimal data"""
         return {
@@ -193,63 +389,40 @@ class RaffleDataGenerator:
             }
         }
     
-    def generate_roster_data(self, num_entries: int) -> List[Dict[str, Any]]:
-        """Generate roster data entries"""
-        roster_data = []
-        for i in range(num_entries):
-            # Generate 30-day totals first, then 10-day totals as subset
-            sales30 = random.randint(0, 5000000)
-            purchases30 = random.randint(0, 100000)
-            
-            # 10-day totals should be <= 30-day totals
-            # Handle edge case where 30-day total is 0
-            if sales30 == 0:
-                sales10 = 0
-            else:
-                sales10 = random.randint(0, sales30)
-                
-            if purchases30 == 0:
-                purchases10 = 0
-            else:
-                purchases10 = random.randint(0, purchases30)
-            
-            entry = {
-                "account": self.generate_username(),
-                "joined": self.generate_timestamp_near_base(365),  # Within a year of base
-                "sales10": sales10,
-                "purchases30": purchases30,
-                "sales30": sales30,
-                "rank": random.choice(RANKS),
-                "purchases10": purchases10
-            }
-            roster_data.append(entry)
-        return roster_data
+    def generate_roster_data(self, num_entries: int) -> List[RosterRec]:
+        """Generate roster data entries, drawing each numeric column in bulk"""
+        bits = self._rand_bits
+        
+        # Generate 30-day totals first, then 10-day totals as subset
+        sales30 = [bits(FAST_RAND_BITS) % 5000001 for _ in range(num_entries)]
+        purchases30 = [bits(FAST_RAND_BITS) % 100001 for _ in range(num_entries)]
+        
+        # 10-day totals should be <= 30-day totals (a total of 0 gives 0)
+        sales10 = [bits(FAST_RAND_BITS) % (total + 1) for total in sales30]
+        purchases10 = [bits(FAST_RAND_BITS) % (total + 1) for total in purchases30]
+        ranks = self._rand.choices(RANKS, k=num_entries)
+        joined = self.generate_timestamps_near_base(num_entries, 365)  # Within a year of base
+        accounts = self._take_usernames(num_entries)
+        
+        # Columns are passed in RosterRec field order
+        return list(map(RosterRec, accounts, joined, sales10, purchases30, sales30, ranks, purchases10))
     
-    def generate_mail_data(self, num_entries: int, ticket_cost: int = 1000) -> List[Dict[str, Any]]:
+    def generate_mail_data(self, num_entries: int, ticket_cost: int = 1000) -> List[MailRec]:
         """Generate mail data entries with amounts mostly divisible by ticket_cost"""
-        mail_data = []
-        for i in range(num_entries):
-            # 90% of users send correct amounts (divisible by ticket_cost)
-            # 10% send incorrect amounts
-            if random.random() < 0.9:
-                # Generate a valid amount (multiple of ticket_cost)
-                num_tickets = random.randint(1, 1000)  # 1 to 1000 tickets
-                amount = num_tickets * ticket_cost
-            else:
-                # Generate an invalid amount (not divisible by ticket_cost)
-                base_amount = random.randint(1, 1000) * ticket_cost
-                # Add a random offset that makes it invalid
-                offset = random.randint(1, ticket_cost - 1)
-                amount = base_amount + offset
-            
-            entry = {
-                "subject": random.choice(MAIL_SUBJECTS),
-                "id": self.generate_mail_id(),
-                "amount": amount,
-                "user": self.generate_username()
-            }
-            mail_data.append(entry)
-        return mail_data
+        bits = self._rand_bits
+        rand = self._rand.random
+        
+        # Every amount is a multiple of ticket_cost (1 to 1000 tickets); 90% of users send
+        # correct amounts, the other 10% get an offset that makes them invalid
+        amounts = [(1 + bits(FAST_RAND_BITS) % 1000) * ticket_cost
+                   + (0 if rand() < 0.9 else 1 + bits(FAST_RAND_BITS) % (ticket_cost - 1))
+                   for _ in range(num_entries)]
+        subjects = self._rand.choices(MAIL_SUBJECTS, k=num_entries)
+        mail_ids = self._take_mail_ids(num_entries)
+        users = self._take_usernames(num_entries)
+        
+        # Columns are passed in MailRec field order
+        return list(map(MailRec, subjects, mail_ids, amounts, users))
     
     def generate_roster_account(self, ticket_cost: int = 1000, roster_entries: int = 10) -> Dict[str, Any]:
         """Generate an account with only roster data"""
@@ -274,9 +447,9 @@ class RaffleDataGenerator:
         }
         
         # Sometimes add body and subject templates
-        if random.random() < 0.7:
-            account_data["body"] = random.choice(MAIL_BODY_TEMPLATES)
-            account_data["subject"] = random.choice(MAIL_SUBJECTS_TEMPLATES)
+        if self._rand.random() < 0.7:
+            account_data["body"] = self._rand.choice(MAIL_BODY_TEMPLATES)
+            account_data["subject"] = self._rand.choice(MAIL_SUBJECTS_TEMPLATES)
         
         return {"$AccountWide": account_data}
     
@@ -293,117 +466,284 @@ class RaffleDataGenerator:
         }
         
         # Sometimes add body and subject templates
-        if random.random() < 0.7:
-            account_data["body"] = random.choice(MAIL_BODY_TEMPLATES)
-            account_data["subject"] = random.choice(MAIL_SUBJECTS_TEMPLATES)
+        if self._rand.random() < 0.7:
+            account_data["body"] = self._rand.choice(MAIL_BODY_TEMPLATES)
+            account_data["subject"] = self._rand.choice(MAIL_SUBJECTS_TEMPLATES)
         
         return {"$AccountWide": account_data}
     
-    def format_lua_value(self, value: Any, indent: int = 0) -> str:
-        """Format a Python value as Lua syntax"""
-        spaces = "    " * indent
+    def format_lua_value(self, value: Any, out: BinaryIO, indent: int = 0) -> None:
+        """Write a Python value to out as UTF-8 encoded Lua syntax"""
+        write = out.write
+        if not (isinstance(value, (dict, list)) and value):
+            self._write_scalar(value, out)
+            return
         
-        if isinstance(value, dict):
-            if not value:
-                return "{}"
+        # Walk nested tables with an explicit stack of (open table's fields, its indent)
+        write(b"{\n")
+        stack = [(_table_fields(value), indent)]
+        while stack:
+            fields, level = stack[-1]
+            field = next(fields, None)
+            if field is None:
+                stack.pop()
+                write(_indent(level) + b"}")
+                if stack:
+                    write(b",\n")
+                continue
             
-            lines = ["{"]
-            for key, val in value.items():
-                if isinstance(key, str):
-                    key_str = f'["{key}"]'
-                else:
-                    key_str = f"[{key}]"
-                
-                val_str = self.format_lua_value(val, indent + 1)
-                lines.append(f"{spaces}    {key_str} = {val_str},")
-            lines.append(f"{spaces}}}")
-            return "\n".join(lines)
-        
-        elif isinstance(value, list):
-            if not value:
-                return "{}"
+            key, key_str, val = field
+            inner = _indent(level + 1)
             
-            lines = ["{"]
-            for i, item in enumerate(value, 1):
-                item_str = self.format_lua_value(item, indent + 1)
-                lines.append(f"{spaces}    [{i}] = {item_str},")
-            lines.append(f"{spaces}}}")
-            return "\n".join(lines)
-        
-        elif isinstance(value, str):
-            # Escape quotes and return as quoted string
-            escaped = value.replace('"', '\\"')
-            return f'"{escaped}"'
-        
-        elif isinstance(value, (int, float)):
-            return str(value)
-        
-        elif isinstance(value, bool):
-            return "true" if value else "false"
+            # Fast path for integer fields such as ["amount"]
+            if type(val) is int:
+                write(b"%s%s = %d,\n" % (inner, key_str, val))
+                continue
+            
+            write(b"%s%s = " % (inner, key_str))
+            
+            # Roster and mail records have a fixed shape, use the specialized emitters; they are
+            # picked by record type, so plain dict entries still take the generic walk below
+            emit_entry = self._entry_emitters.get(type(val))
+            if emit_entry is None and type(val) is list and val:
+                emit_entry = self._entry_emitters.get(type(val[0]))
+                if emit_entry is not None and all(type(entry) is type(val[0]) for entry in val):
+                    self._emit_entry_list(val, out, level + 1, emit_entry)
+                    write(b",\n")
+                    continue
+                emit_entry = None
+            
+            if emit_entry is not None:
+                emit_entry(val, out, level + 1)
+                write(b",\n")
+            elif isinstance(val, (dict, list)) and val:
+                write(b"{\n")
+                stack.append((_table_fields(val), level + 1))
+            else:
+                self._write_scalar(val, out)
+                write(b",\n")
+    
+    def _write_scalar(self, value: Any, out: BinaryIO) -> None:
+        """Write a string, number, boolean or empty table to out as Lua syntax"""
+        writer = _SCALAR_WRITERS.get(type(value))
+        if writer is None:
+            writer = _scalar_writer_for(value)
+        writer(value, out)
+    
+    def _emit_entry_list(self, entries: List[Any], out: BinaryIO, indent: int,
+                         emit_entry: Callable[[Any, BinaryIO, int], None]) -> None:
+        """Write a list of same-shaped entries using a specialized entry emitter"""
+        if not entries:
+            out.write(b"{}")
+            return
         
-        else:
-            return str(value)
-    
-    def generate_file(self, blank_count: int, roster_count: int, 
-                     mail_count: int, mixed_count: int, filename: str, 
-                     ticket_cost: int = 1000, roster_entries: int = 10, mail_entries: int = 10):
-        """Generate a complete .lua file with specified account types"""
-        accounts = {}
+        inner = _indent(indent + 1)
+        out.write(b"{\n")
+        for i, entry in enumerate(entries, 1):
+            out.write(b"%s[%d] = " % (inner, i))
+            emit_entry(entry, out, indent + 1)
+            out.write(b",\n")
+        out.write(_indent(indent) + b"}")
+    
+    def _emit_roster_entry(self, entry: RosterRec, out: BinaryIO, indent: int) -> None:
+        """Write a roster entry with its known field order and types"""
+        out.write(_entry_layout(_ROSTER_ENTRY_FIELDS, indent) % (
+            _lua_string(entry.account), entry.joined, entry.sales10, entry.purchases30,
+            entry.sales30, _lua_string(entry.rank), entry.purchases10))
+    
+    def _emit_mail_entry(self, entry: MailRec, out: BinaryIO, indent: int) -> None:
+        """Write a mail entry with its known field order and types"""
+        out.write(_entry_layout(_MAIL_ENTRY_FIELDS, indent) % (
+            _lua_string(entry.subject), _lua_string(entry.id), entry.amount,
+            _lua_string(entry.user)))
+    
+    def _write_chunk(self, chunk: AccountChunk, out: BinaryIO) -> None:
+        """Generate the accounts of one chunk and write them as entries of the Default table"""
+        blank_count, roster_count, mail_count, mixed_count = chunk.counts
+        ticket_cost, roster_entries, mail_entries = chunk.ticket_cost, chunk.roster_entries, chunk.mail_entries
+        self._usernames = iter(chunk.usernames)
+        self._mail_ids = iter(chunk.mail_ids)
         
-        # Generate blank accounts
+        # Each account is drawn and written straight to out, without building its dict
         for _ in range(blank_count):
-            username = self.generate_username()
-            accounts[username] = self.generate_blank_account(ticket_cost)
+            self._emit_blank_account(self.generate_username(), ticket_cost, out)
         
-        # Generate roster accounts
         for _ in range(roster_count):
-            username = self.generate_username()
-            accounts[username] = self.generate_roster_account(ticket_cost, roster_entries)
+            self._emit_roster_account(self.generate_username(), ticket_cost, roster_entries, out)
         
-        # Generate mail accounts
+        # Body/subject templates for every mail and mixed account are drawn up front
+        templates = iter(self._draw_mail_templates(mail_count + mixed_count))
         for _ in range(mail_count):
-            username = self.generate_username()
-            accounts[username] = self.generate_mail_account(ticket_cost, mail_entries)
+            self._emit_mail_account(self.generate_username(), ticket_cost, mail_entries, next(templates), out)
         
-        # Generate mixed accounts
         for _ in range(mixed_count):
-            username = self.generate_username()
-            accounts[username] = self.generate_mixed_account(ticket_cost, roster_entries, mail_entries)
+            self._emit_mixed_account(self.generate_username(), ticket_cost, roster_entries, mail_entries,
+                                     next(templates), out)
+    
+    # The _emit_*_account methods write the same Lua as format_lua_value does for the
+    # matching generate_*_account dict
+    def _emit_blank_account(self, username: str, ticket_cost: int, out: BinaryIO) -> None:
+        """Write a blank account as an entry of the Default table"""
+        out.write(_ACCOUNT_HEAD % (_lua_string(username), ticket_cost))
+        out.write(_ACCOUNT_TAIL)
+    
+    def _emit_roster_account(self, username: str, ticket_cost: int, roster_entries: int,
+                             out: BinaryIO) -> None:
+        """Write an account with only roster data as an entry of the Default table"""
+        roster_data = self.generate_roster_data(roster_entries)
+        roster_timestamp = self.generate_timestamp_near_base(7)  # Within a week
         
-        # Create the full data structure
-        data = {
-            "RaffleManager_SavedVariables": {
-                "Default": accounts
-            }
-        }
+        out.write(_ACCOUNT_HEAD % (_lua_string(username), ticket_cost))
+        self._emit_roster_fields(roster_data, roster_timestamp, out)
+        out.write(_ACCOUNT_TAIL)
+    
+    def _emit_mail_account(self, username: str, ticket_cost: int, mail_entries: int,
+                           templates: bytes, out: BinaryIO) -> None:
+        """Write an account with only mail data as an entry of the Default table"""
+        mail_data = self.generate_mail_data(mail_entries, ticket_cost)
+        timestamp = self.generate_timestamp_near_base(7)  # Within a week
         
-        # Format as Lua
-        lua_content = f"RaffleManager_SavedVariables =\n{self.format_lua_value(data['RaffleManager_SavedVariables'])}\n"
+        out.write(_ACCOUNT_HEAD % (_lua_string(username), ticket_cost))
+        self._emit_mail_fields(mail_data, timestamp, out)
+        out.write(templates)
+        out.write(_ACCOUNT_TAIL)
+    
+    def _emit_mixed_account(self, username: str, ticket_cost: int, roster_entries: int,
+                            mail_entries: int, templates: bytes, out: BinaryIO) -> None:
+        """Write an account with both roster and mail data as an entry of the Default table"""
+        mail_data = self.generate_mail_data(mail_entries, ticket_cost)
+        timestamp = self.generate_timestamp_near_base(7)  # Within a week
+        roster_data = self.generate_roster_data(roster_entries)
+        roster_timestamp = self.generate_timestamp_near_base(7)  # Within a week
         
-        # Write to file
-        with open(filename, 'w', encoding='utf-8') as f:
-            f.write(lua_content)
+        out.write(_ACCOUNT_HEAD % (_lua_string(username), ticket_cost))
+        self._emit_mail_fields(mail_data, timestamp, out)
+        self._emit_roster_fields(roster_data, roster_timestamp, out)
+        out.write(templates)
+        out.write(_ACCOUNT_TAIL)
+    
+    def _emit_roster_fields(self, roster_data: List[RosterRec], roster_timestamp: int,
+                            out: BinaryIO) -> None:
+        """Write the roster_data and roster_timestamp fields of an account"""
+        out.write(_ROSTER_DATA_KEY)
+        self._emit_entry_list(roster_data, out, 4, self._emit_roster_entry)
+        out.write(b",\n" + _ROSTER_TIMESTAMP_FIELD % roster_timestamp)
+    
+    def _emit_mail_fields(self, mail_data: List[MailRec], timestamp: int, out: BinaryIO) -> None:
+        """Write the mail_data and timestamp fields of an account"""
+        out.write(_MAIL_DATA_KEY)
+        self._emit_entry_list(mail_data, out, 4, self._emit_mail_entry)
+        out.write(b",\n" + _MAIL_TIMESTAMP_FIELD % timestamp)
+    
+    def _draw_mail_templates(self, count: int) -> List[bytes]:
+        """Draw the body/subject template fields for count mail accounts (empty if not included)"""
+        rand = self._rand.random
+        bodies = self._rand.choices(MAIL_BODY_TEMPLATES, k=count)
+        subjects = self._rand.choices(MAIL_SUBJECTS_TEMPLATES, k=count)
         
+        # Sometimes add body and subject templates
+        return [_MAIL_TEMPLATE_FIELDS % (_QUOTED_TEMPLATES[body], _QUOTED_TEMPLATES[subject])
+                if rand() < 0.7 else b""
+                for body, subject in zip(bodies, subjects)]
+    
+    def generate_file(self, blank_count: int, roster_count: int, 
+                     mail_count: int, mixed_count: int, filename: str, 
+                     ticket_cost: int = 1000, roster_entries: int = 10, mail_entries: int = 10):
+        """Generate a complete .lua file with specified account types"""
         total_accounts = blank_count + roster_count + mail_count + mixed_count
+        total_roster_entries = (roster_count + mixed_count) * roster_entries
+        total_mail_entries = (mail_count + mixed_count) * mail_entries
+        total_records = total_accounts + total_roster_entries + total_mail_entries
+        
+        # Draw every username and mail ID up front so each is unique without retries
+        usernames = iter(self.generate_usernames_batch(total_records))
+        mail_ids = iter(self._rand.sample(MAIL_ID_RANGE, total_mail_entries))
+        
+        # Uniqueness only matters within one file, release the bookkeeping before generating
+        self.used_usernames.clear()
+        
+        # Accounts don't depend on each other, so large files are split across processes
+        workers = (os.cpu_count() or 1) if total_records >= PARALLEL_MIN_RECORDS else 1
+        chunk_size = max(1, CHUNK_RECORDS * total_accounts // max(1, total_records))
+        chunks = []
+        for counts in _split_counts((blank_count, roster_count, mail_count, mixed_count), chunk_size):
+            chunk_blank, chunk_roster, chunk_mail, chunk_mixed = counts
+            chunk_usernames = (sum(counts) + (chunk_roster + chunk_mixed) * roster_entries
+                               + (chunk_mail + chunk_mixed) * mail_entries)
+            chunk_mail_ids = (chunk_mail + chunk_mixed) * mail_entries
+            chunks.append(AccountChunk(self.base_timestamp, self._rand.getrandbits(64), counts,
+                                       list(itertools.islice(usernames, chunk_usernames)),
+                                       list(itertools.islice(mail_ids, chunk_mail_ids)),
+                                       ticket_cost, roster_entries, mail_entries))
+        
+        # Stream the encoded Lua straight to the file instead of building it in memory
+        with open(filename, 'wb', buffering=WRITE_BUFFER_SIZE) as f:
+            f.write(b'RaffleManager_SavedVariables =\n{\n    ["Default"] = ')
+            if not chunks:
+                f.write(b"{}")
+            else:
+                f.write(b"{\n")
+                # Each chunk is generated from its own seed, drawn from this generator's stream
+                if workers > 1:
+                    with multiprocessing.Pool(workers) as pool:
+                        for block in pool.imap(_generate_chunk, chunks):
+                            f.write(block)
+                else:
+                    for chunk in chunks:
+                        RaffleDataGenerator(chunk.base_timestamp, chunk.seed)._write_chunk(chunk, f)
+                f.write(b"    }")
+            f.write(b",\n}\n")
+        
         print(f"Generated {filename} with {total_accounts} accounts:")
         print(f"  - {blank_count} blank accounts")
         print(f"  - {roster_count} roster accounts ({roster_entries} entries each)")
         print(f"  - {mail_count} mail accounts ({mail_entries} entries each)")
         print(f"  - {mixed_count} mixed accounts ({roster_entries} roster + {mail_entries} mail entries each)")
 
+def _split_counts(counts: Tuple[int, ...], chunk_size: int):
+    """Split per-type account counts into consecutive chunks of at most chunk_size accounts"""
+    chunk = [0] * len(counts)
+    filled = 0
+    for type_index, count in enumerate(counts):
+        while count:
+            take = min(count, chunk_size - filled)
+            chunk[type_index] += take
+            filled += take
+            count -= take
+            if filled == chunk_size:
+                yield tuple(chunk)
+                chunk = [0] * len(counts)
+                filled = 0
+    if filled:
+        yield tuple(chunk)
+
+def _generate_chunk(chunk: AccountChunk) -> bytes:
+    """Generate one chunk of accounts as encoded Lua (runs in a worker process)"""
+    out = io.BytesIO()
+    RaffleDataGenerator(chunk.base_timestamp, chunk.seed)._write_chunk(chunk, out)
+    return out.getvalue()
+
 def get_unique_filename(base_name: str) -> str:
     """Generate a unique filename by appending a number if needed"""
-    if not os.path.exists(base_name):
+    # List the directory once instead of stat-ing every candidate name; names are
+    # compared through normcase, so case-insensitive filesystems (Windows) still match
+    directory = os.path.dirname(base_name) or '.'
+    try:
+        with os.scandir(directory) as entries:
+            existing = {os.path.normcase(entry.name) for entry in entries}
+    except FileNotFoundError:
+        return base_name
+    
+    if os.path.normcase(os.path.basename(base_name)) not in existing:
         return base_name
     
     name, ext = os.path.splitext(base_name)
+    stem = os.path.basename(name)
     counter = 1
     
-    while True:
-        new_name = f"{name}_{counter}{ext}"
-        if not os.path.exists(new_name):
-            return new_name
+    while os.path.normcase(f"{stem}_{counter}{ext}") in existing:
         counter += 1
+    return f"{name}_{counter}{ext}"
 
 def find_most_recent_generated_file() -> str:
     """Find the most recently generated RaffleManager file"""
@@ -439,6 +779,7 @@ def find_most_recent_generated_file() -> str:
 def main():
     # Load configuration
     config = load_config()
+    saved_config = copy.deepcopy(config)  # The timestamp options update a nested dict in place
     
     parser = argparse.ArgumentParser(
         description="Generate .lua data files for RaffleManager ESO addon testing",
@@ -481,6 +822,10 @@ Examples:
                        help='Base timestamp date in MM/DD/YYYY format (default: 07/20/2025)')
     parser.add_argument('--timestamp-time', type=str,
                        help='Base timestamp time in HH:MM:SS format (default: 00:00:00)')
+    parser.add_argument('--seed', type=int,
+                       help='Random seed for reproducible output (default: random)')
+    parser.add_argument('--no-save-config', action='store_true',
+                       help='Use the given settings for this run only, without saving them to the config file')
     parser.add_argument('--reset-config', action='store_true',
                        help='Reset all settings to program defaults and exit')
     
@@ -548,7 +893,7 @@ Examples:
         
         config['timestamp_config'] = timestamp_config
     
-    # Update and save configuration with new values
+    # Update configuration with new values, saving it only if something changed
     config['default_ticket_cost'] = args.ticket_cost
     config['roster_entries_per_account'] = args.roster_entries
     config['mail_entries_per_account'] = args.mail_entries
@@ -556,7 +901,8 @@ Examples:
         config['default_output_filename'] = args.filename
     if args.output_folder:
         config['output_folder'] = args.output_folder
-    save_config(config)
+    if config != saved_config and not args.no_save_config:
+        save_config(config)
     
     # Determine filename
     if args.filename:
@@ -575,7 +921,7 @@ Examples:
     
     # Generate the file
     base_timestamp = timestamp_config_to_unix(config.get('timestamp_config', {}))
-    generator = RaffleDataGenerator(base_timestamp)
+    generator = RaffleDataGenerator(base_timestamp, args.seed)
     generator.generate_file(args.blank_count, args.roster_count, 
                            args.mail_count, args.mixed_count, filename, 
                            args.ticket_cost, args.roster_entries, args.mail_entries)
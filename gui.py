@@ -7,13 +7,21 @@ A sleek, hacker-themed interface for generating ESO addon test data.
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 import os
-import json
 import threading
+import queue
 import subprocess
-import sys
 import time
+import copy
+import contextlib
+import io
 from typing import Dict, Any
-from generate_raffle_data import RaffleDataGenerator, load_config, save_config, DEFAULT_CONFIG, find_most_recent_generated_file, timestamp_config_to_unix
+from generate_raffle_data import load_config, save_config, DEFAULT_CONFIG, find_most_recent_generated_file
+from validate import validate_roster_data
+
+try:
+    from check_amounts import check_amounts
+except ImportError:
+    check_amounts = None
 
 class HackerTheme:
     """Color scheme and styling for the hacker aesthetic"""
@@ -30,14 +38,98 @@ class HackerTheme:
     WARNING = "#ffaa00"          # Orange for warnings
     SUCCESS = "#00ff88"          # Bright green for success
 
+# Color tag and prefix for each log level
+_LEVEL_META = {
+    "error": ("error", "❌"),
+    "warning": ("warning", "⚠️"),
+    "success": ("success", "✅"),
+    "info": ("info", "ℹ️")
+}
+
+# Shared widget options for the repeated section parts
+SECTION_FRAME_STYLE = {'bg': HackerTheme.BG_MEDIUM, 'relief': 'ridge', 'bd': 1}
+SECTION_HEADER_STYLE = {'font': ('Consolas', 12, 'bold'), 'fg': HackerTheme.FG_PRIMARY, 'bg': HackerTheme.BG_MEDIUM}
+FIELD_LABEL_STYLE = {'font': ('Consolas', 10), 'fg': HackerTheme.FG_SECONDARY, 'bg': HackerTheme.BG_MEDIUM}
+TIMESTAMP_LABEL_STYLE = {'font': ('Consolas', 9), 'fg': HackerTheme.FG_SECONDARY, 'bg': HackerTheme.BG_MEDIUM}
+
+# Settings restored by "Reset to defaults"
+_FACTORY_DEFAULTS = {
+    **DEFAULT_CONFIG,
+    'account_types_enabled': {'blank': True, 'roster': True, 'mail': True, 'mixed': True},
+    'account_counts': {'blank': 5, 'roster': 10, 'mail': 15, 'mixed': 20},
+}
+
+LOG_DRAIN_MS = 50  # How often worker log messages are moved into the output log
+
+def _run_captured(func, *args):
+    """Call func, returning its result and everything it printed"""
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        result = func(*args)
+    return result, output.getvalue().strip()
+
 class RaffleManagerGUI:
     def __init__(self):
         self.root = tk.Tk()
-        self.config = load_config()
+        self.config = DEFAULT_CONFIG.copy()  # Replaced by the saved config once it has been read
+        self._preview_after_id = None
+        self._scroll_after_id = None
+        self._log_pending = []  # (line, color tag) pairs waiting for _flush_log
+        self._log_q = queue.Queue()  # (message, level) pairs posted by the worker thread
+        self._config_q = queue.Queue()  # The saved config, once the worker has read it
+        self._last_validation = None  # ((path, mtime, size), logged results) of the last validation
+        self._unsaved_config = None  # Snapshot waiting for _flush_config to write
+        self._config_lock = threading.Lock()
+        self.int_values: Dict[str, Any] = {}  # Parsed numeric fields, None while invalid
         self.setup_window()
         self.setup_styles()
         self.create_widgets()
         self.load_settings()
+        self._initial_settings = self._settings_snapshot()
+        self.root.after(LOG_DRAIN_MS, self._drain_log)
+        
+        # One long-lived worker runs config loading, generation and validation jobs in order
+        self._jobs = queue.Queue()
+        self._latest_jobs = {}
+        threading.Thread(target=self._worker_loop, daemon=True).start()
+        
+        # Read the saved config off the UI thread so the window can paint first
+        self._submit_job("load_config", self._load_config_async)
+        
+    def _load_config_async(self):
+        """Read the saved config (runs in the worker thread)"""
+        self._config_q.put(load_config())
+        
+    def _apply_loaded_config(self, config: Dict[str, Any]):
+        """Show the saved config once it has been read, unless the user already edited the settings"""
+        self.config = config
+        if self._settings_snapshot() == self._initial_settings:
+            self.load_settings()
+        
+    def _settings_snapshot(self) -> list:
+        """Return the current value of every settings field"""
+        variables = [*self.account_vars.values(), *self.count_vars.values(),
+                     self.ticket_cost_var, self.roster_entries_var, self.mail_entries_var,
+                     self.filename_var, self.output_folder_var,
+                     self.month_var, self.day_var, self.year_var,
+                     self.hour_var, self.minute_var, self.second_var]
+        return [var.get() for var in variables]
+        
+    def _submit_job(self, kind: str, job):
+        """Queue a background job, superseding a queued job of the same kind that hasn't started"""
+        self._latest_jobs[kind] = job
+        self._jobs.put((kind, job))
+        
+    def _worker_loop(self):
+        """Run queued jobs one at a time (runs in the worker thread)"""
+        while True:
+            kind, job = self._jobs.get()
+            if self._latest_jobs.get(kind) is job:
+                # A failing job is reported, it must not take the only worker down with it
+                try:
+                    job()
+                except Exception as e:
+                    self._post_log(f"Background task '{kind}' failed: {str(e)}", "error")
         
     def setup_window(self):
         """Configure the main window"""
@@ -53,6 +145,7 @@ class RaffleManagerGUI:
         # Use 80% of screen size or preferred size, whichever is smaller
         preferred_width = min(800, int(screen_width * 0.8))
         preferred_height = min(700, int(screen_height * 0.8))
+        self.preferred_width = preferred_width
         
         # Center the window
         x = (screen_width - preferred_width) // 2
@@ -103,10 +196,7 @@ class RaffleManagerGUI:
         self.scrollable_frame = tk.Frame(self.canvas, bg=HackerTheme.BG_DARK)
         
         # Configure scrolling
-        self.scrollable_frame.bind(
-            "<Configure>",
-            lambda e: self.canvas.configure(scrollregion=self.canvas.bbox("all"))
-        )
+        self.scrollable_frame.bind("<Configure>", self.schedule_scrollregion)
         
         self.canvas.create_window((0, 0), window=self.scrollable_frame, anchor="nw")
         self.canvas.configure(yscrollcommand=self.scrollbar.set)
@@ -151,19 +241,39 @@ class RaffleManagerGUI:
         # Bind mousewheel to canvas for scrolling
         self.bind_mousewheel()
         
+    def schedule_scrollregion(self, event=None):
+        """Update the scroll region once the current burst of geometry changes settles"""
+        if self._scroll_after_id is None:
+            self._scroll_after_id = self.root.after_idle(self._update_scrollregion)
+        
+    def _update_scrollregion(self):
+        """Resize the canvas scroll region to fit the settings frame"""
+        # The frame is the canvas's only item, so its size is the whole scroll region
+        self._scroll_after_id = None
+        self.canvas.configure(scrollregion=(0, 0, self.scrollable_frame.winfo_width(),
+                                            self.scrollable_frame.winfo_height()))
+        
     def bind_mousewheel(self):
         """Bind mousewheel events for scrolling"""
-        def _on_mousewheel(event):
-            self.canvas.yview_scroll(int(-1*(event.delta/120)), "units")
-        
-        def _bind_to_mousewheel(event):
-            self.canvas.bind_all("<MouseWheel>", _on_mousewheel)
+        canvas_path = str(self.canvas)
         
-        def _unbind_from_mousewheel(event):
-            self.canvas.unbind_all("<MouseWheel>")
+        def _on_mousewheel(event):
+            # Bound once for the whole app, so only scroll when the pointer is over the canvas
+            if not str(event.widget).startswith(canvas_path):
+                return
+            # The output log sits inside the canvas but scrolls itself through its class binding
+            if isinstance(event.widget, tk.Text):
+                return
+            if event.num == 4:  # X11 wheel up
+                units = -1
+            elif event.num == 5:  # X11 wheel down
+                units = 1
+            else:
+                units = int(-1*(event.delta/120))
+            self.canvas.yview_scroll(units, "units")
         
-        self.canvas.bind('<Enter>', _bind_to_mousewheel)
-        self.canvas.bind('<Leave>', _unbind_from_mousewheel)
+        for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self.root.bind_all(sequence, _on_mousewheel)
         
     def create_header(self, parent):
         """Create the application header"""
@@ -171,8 +281,8 @@ class RaffleManagerGUI:
         header_frame.grid(row=0, column=0, sticky="ew", pady=(0, 15))
         header_frame.grid_columnconfigure(0, weight=1)
         
-        # Check if we're in a small window
-        is_compact = self.root.winfo_width() < 750 if hasattr(self.root, 'winfo_width') else False
+        # Check if we're in a small window; it isn't mapped yet, so use the width it was given
+        is_compact = self.preferred_width < 750
         
         if is_compact:
             # Compact header for small screens
@@ -208,7 +318,7 @@ class RaffleManagerGUI:
     def create_account_types_section(self, parent):
         """Create account types configuration section"""
         # Section frame with border effect
-        section_frame = tk.Frame(parent, bg=HackerTheme.BG_MEDIUM, relief='ridge', bd=1)
+        section_frame = tk.Frame(parent, **SECTION_FRAME_STYLE)
         section_frame.grid(row=1, column=0, sticky="ew", pady=(0, 15))
         section_frame.grid_columnconfigure(1, weight=1)
         section_frame.grid_columnconfigure(3, weight=1)
@@ -216,9 +326,7 @@ class RaffleManagerGUI:
         # Section header
         header_label = tk.Label(section_frame,
                                text=">>> ACCOUNT TYPES <<<",
-                               font=('Consolas', 12, 'bold'),
-                               fg=HackerTheme.FG_PRIMARY,
-                               bg=HackerTheme.BG_MEDIUM)
+                               **SECTION_HEADER_STYLE)
         header_label.grid(row=0, column=0, columnspan=4, pady=10)
         
         # Account type controls
@@ -243,18 +351,19 @@ class RaffleManagerGUI:
                                      text=f"[{display_name}]",
                                      variable=var,
                                      style='Hacker.TCheckbutton',
-                                     command=self.update_preview)
+                                     command=self.schedule_preview)
             checkbox.grid(row=row, column=0, sticky="w", padx=10, pady=5)
             
             # Count entry
             count_var = tk.StringVar()
             self.count_vars[key] = count_var
+            self._track_int(count_var, key, "0")
             count_entry = ttk.Entry(section_frame,
                                    textvariable=count_var,
                                    width=8,
                                    style='Hacker.TEntry')
             count_entry.grid(row=row, column=1, padx=(10, 20), pady=5)
-            count_entry.bind('<KeyRelease>', lambda e: self.update_preview())
+            count_entry.bind('<KeyRelease>', self.schedule_preview)
             self.count_entries[key] = count_entry
             
             # Description
@@ -268,7 +377,7 @@ class RaffleManagerGUI:
             
     def create_settings_section(self, parent):
         """Create settings configuration section"""
-        section_frame = tk.Frame(parent, bg=HackerTheme.BG_MEDIUM, relief='ridge', bd=1)
+        section_frame = tk.Frame(parent, **SECTION_FRAME_STYLE)
         section_frame.grid(row=2, column=0, sticky="ew", pady=(0, 15))
         section_frame.grid_columnconfigure(1, weight=1)
         section_frame.grid_columnconfigure(3, weight=1)
@@ -276,66 +385,62 @@ class RaffleManagerGUI:
         # Section header
         header_label = tk.Label(section_frame,
                                text=">>> CONFIGURATION <<<",
-                               font=('Consolas', 12, 'bold'),
-                               fg=HackerTheme.FG_PRIMARY,
-                               bg=HackerTheme.BG_MEDIUM)
+                               **SECTION_HEADER_STYLE)
         header_label.grid(row=0, column=0, columnspan=4, pady=10)
         
         # Ticket Cost
-        tk.Label(section_frame, text="[TICKET_COST]", font=('Consolas', 10),
-                fg=HackerTheme.FG_SECONDARY, bg=HackerTheme.BG_MEDIUM).grid(row=1, column=0, sticky="w", padx=10, pady=5)
+        tk.Label(section_frame, text="[TICKET_COST]", **FIELD_LABEL_STYLE).grid(row=1, column=0, sticky="w", padx=10, pady=5)
         
         self.ticket_cost_var = tk.StringVar()
+        self._track_int(self.ticket_cost_var, 'ticket_cost', "1000")
         ticket_cost_entry = ttk.Entry(section_frame, textvariable=self.ticket_cost_var, width=15, style='Hacker.TEntry')
         ticket_cost_entry.grid(row=1, column=1, sticky="w", padx=10, pady=5)
-        ticket_cost_entry.bind('<KeyRelease>', lambda e: self.update_preview())
+        ticket_cost_entry.bind('<KeyRelease>', self.schedule_preview)
+        ticket_cost_entry.bind('<Return>', self.generate_data)
         
         # Roster Entries
-        tk.Label(section_frame, text="[ROSTER_ENTRIES]", font=('Consolas', 10),
-                fg=HackerTheme.FG_SECONDARY, bg=HackerTheme.BG_MEDIUM).grid(row=1, column=2, sticky="w", padx=10, pady=5)
+        tk.Label(section_frame, text="[ROSTER_ENTRIES]", **FIELD_LABEL_STYLE).grid(row=1, column=2, sticky="w", padx=10, pady=5)
         
         self.roster_entries_var = tk.StringVar()
+        self._track_int(self.roster_entries_var, 'roster_entries', "10")
         roster_entries_entry = ttk.Entry(section_frame, textvariable=self.roster_entries_var, width=15, style='Hacker.TEntry')
         roster_entries_entry.grid(row=1, column=3, sticky="w", padx=10, pady=5)
-        roster_entries_entry.bind('<KeyRelease>', lambda e: self.update_preview())
+        roster_entries_entry.bind('<KeyRelease>', self.schedule_preview)
+        roster_entries_entry.bind('<Return>', self.generate_data)
         
         # Mail Entries
-        tk.Label(section_frame, text="[MAIL_ENTRIES]", font=('Consolas', 10),
-                fg=HackerTheme.FG_SECONDARY, bg=HackerTheme.BG_MEDIUM).grid(row=2, column=0, sticky="w", padx=10, pady=5)
+        tk.Label(section_frame, text="[MAIL_ENTRIES]", **FIELD_LABEL_STYLE).grid(row=2, column=0, sticky="w", padx=10, pady=5)
         
         self.mail_entries_var = tk.StringVar()
+        self._track_int(self.mail_entries_var, 'mail_entries', "10")
         mail_entries_entry = ttk.Entry(section_frame, textvariable=self.mail_entries_var, width=15, style='Hacker.TEntry')
         mail_entries_entry.grid(row=2, column=1, sticky="w", padx=10, pady=5)
-        mail_entries_entry.bind('<KeyRelease>', lambda e: self.update_preview())
+        mail_entries_entry.bind('<KeyRelease>', self.schedule_preview)
+        mail_entries_entry.bind('<Return>', self.generate_data)
         
     def create_timestamp_section(self, parent):
         """Create timestamp configuration section"""
-        section_frame = tk.Frame(parent, bg=HackerTheme.BG_MEDIUM, relief='ridge', bd=1)
+        section_frame = tk.Frame(parent, **SECTION_FRAME_STYLE)
         section_frame.grid(row=2, column=0, sticky="ew", pady=(0, 15))
         
         # Section header
         header_label = tk.Label(section_frame,
                                text=">>> TIMESTAMP CONFIG <<<",
-                               font=('Consolas', 12, 'bold'),
-                               fg=HackerTheme.FG_PRIMARY,
-                               bg=HackerTheme.BG_MEDIUM)
+                               **SECTION_HEADER_STYLE)
         header_label.grid(row=0, column=0, columnspan=7, pady=10)
         
         # Month/Day/Year
-        tk.Label(section_frame, text="MM", font=('Consolas', 9),
-                fg=HackerTheme.FG_SECONDARY, bg=HackerTheme.BG_MEDIUM).grid(row=1, column=0, padx=5, pady=5)
+        tk.Label(section_frame, text="MM", **TIMESTAMP_LABEL_STYLE).grid(row=1, column=0, padx=5, pady=5)
         self.month_var = tk.StringVar()
         month_entry = ttk.Entry(section_frame, textvariable=self.month_var, width=3, style='Hacker.TEntry')
         month_entry.grid(row=2, column=0, padx=5, pady=5)
         
-        tk.Label(section_frame, text="DD", font=('Consolas', 9),
-                fg=HackerTheme.FG_SECONDARY, bg=HackerTheme.BG_MEDIUM).grid(row=1, column=1, padx=5, pady=5)
+        tk.Label(section_frame, text="DD", **TIMESTAMP_LABEL_STYLE).grid(row=1, column=1, padx=5, pady=5)
         self.day_var = tk.StringVar()
         day_entry = ttk.Entry(section_frame, textvariable=self.day_var, width=3, style='Hacker.TEntry')
         day_entry.grid(row=2, column=1, padx=5, pady=5)
         
-        tk.Label(section_frame, text="YYYY", font=('Consolas', 9),
-                fg=HackerTheme.FG_SECONDARY, bg=HackerTheme.BG_MEDIUM).grid(row=1, column=2, padx=5, pady=5)
+        tk.Label(section_frame, text="YYYY", **TIMESTAMP_LABEL_STYLE).grid(row=1, column=2, padx=5, pady=5)
         self.year_var = tk.StringVar()
         year_entry = ttk.Entry(section_frame, textvariable=self.year_var, width=5, style='Hacker.TEntry')
         year_entry.grid(row=2, column=2, padx=5, pady=5)
@@ -345,41 +450,35 @@ class RaffleManagerGUI:
                 fg=HackerTheme.FG_ACCENT, bg=HackerTheme.BG_MEDIUM).grid(row=1, column=3, rowspan=2, padx=10)
         
         # Hour/Minute/Second
-        tk.Label(section_frame, text="HH", font=('Consolas', 9),
-                fg=HackerTheme.FG_SECONDARY, bg=HackerTheme.BG_MEDIUM).grid(row=1, column=4, padx=5, pady=5)
+        tk.Label(section_frame, text="HH", **TIMESTAMP_LABEL_STYLE).grid(row=1, column=4, padx=5, pady=5)
         self.hour_var = tk.StringVar()
         hour_entry = ttk.Entry(section_frame, textvariable=self.hour_var, width=3, style='Hacker.TEntry')
         hour_entry.grid(row=2, column=4, padx=5, pady=5)
         
-        tk.Label(section_frame, text="MM", font=('Consolas', 9),
-                fg=HackerTheme.FG_SECONDARY, bg=HackerTheme.BG_MEDIUM).grid(row=1, column=5, padx=5, pady=5)
+        tk.Label(section_frame, text="MM", **TIMESTAMP_LABEL_STYLE).grid(row=1, column=5, padx=5, pady=5)
         self.minute_var = tk.StringVar()
         minute_entry = ttk.Entry(section_frame, textvariable=self.minute_var, width=3, style='Hacker.TEntry')
         minute_entry.grid(row=2, column=5, padx=5, pady=5)
         
-        tk.Label(section_frame, text="SS", font=('Consolas', 9),
-                fg=HackerTheme.FG_SECONDARY, bg=HackerTheme.BG_MEDIUM).grid(row=1, column=6, padx=5, pady=5)
+        tk.Label(section_frame, text="SS", **TIMESTAMP_LABEL_STYLE).grid(row=1, column=6, padx=5, pady=5)
         self.second_var = tk.StringVar()
         second_entry = ttk.Entry(section_frame, textvariable=self.second_var, width=3, style='Hacker.TEntry')
         second_entry.grid(row=2, column=6, padx=5, pady=5)
         
     def create_output_section(self, parent):
         """Create output file configuration section"""
-        section_frame = tk.Frame(parent, bg=HackerTheme.BG_MEDIUM, relief='ridge', bd=1)
+        section_frame = tk.Frame(parent, **SECTION_FRAME_STYLE)
         section_frame.grid(row=4, column=0, sticky="ew", pady=(0, 15))
         section_frame.grid_columnconfigure(1, weight=1)
         
         # Section header
         header_label = tk.Label(section_frame,
                                text=">>> OUTPUT FILE <<<",
-                               font=('Consolas', 12, 'bold'),
-                               fg=HackerTheme.FG_PRIMARY,
-                               bg=HackerTheme.BG_MEDIUM)
+                               **SECTION_HEADER_STYLE)
         header_label.grid(row=0, column=0, columnspan=3, pady=10)
         
         # Filename
-        tk.Label(section_frame, text="[FILENAME]", font=('Consolas', 10),
-                fg=HackerTheme.FG_SECONDARY, bg=HackerTheme.BG_MEDIUM).grid(row=1, column=0, sticky="w", padx=10, pady=5)
+        tk.Label(section_frame, text="[FILENAME]", **FIELD_LABEL_STYLE).grid(row=1, column=0, sticky="w", padx=10, pady=5)
         
         self.filename_var = tk.StringVar()
         filename_entry = ttk.Entry(section_frame, textvariable=self.filename_var, style='Hacker.TEntry')
@@ -393,8 +492,7 @@ class RaffleManagerGUI:
         browse_btn.grid(row=1, column=2, padx=10, pady=5)
         
         # Output folder
-        tk.Label(section_frame, text="[FOLDER]", font=('Consolas', 10),
-                fg=HackerTheme.FG_SECONDARY, bg=HackerTheme.BG_MEDIUM).grid(row=2, column=0, sticky="w", padx=10, pady=5)
+        tk.Label(section_frame, text="[FOLDER]", **FIELD_LABEL_STYLE).grid(row=2, column=0, sticky="w", padx=10, pady=5)
         
         self.output_folder_var = tk.StringVar()
         folder_entry = ttk.Entry(section_frame, textvariable=self.output_folder_var, style='Hacker.TEntry')
@@ -409,16 +507,14 @@ class RaffleManagerGUI:
         
     def create_preview_section(self, parent):
         """Create data preview section"""
-        section_frame = tk.Frame(parent, bg=HackerTheme.BG_MEDIUM, relief='ridge', bd=1)
+        section_frame = tk.Frame(parent, **SECTION_FRAME_STYLE)
         section_frame.grid(row=5, column=0, sticky="ew", pady=(0, 15))
         section_frame.grid_columnconfigure(0, weight=1)
         
         # Section header
         header_label = tk.Label(section_frame,
                                text=">>> GENERATION PREVIEW <<<",
-                               font=('Consolas', 12, 'bold'),
-                               fg=HackerTheme.FG_PRIMARY,
-                               bg=HackerTheme.BG_MEDIUM)
+                               **SECTION_HEADER_STYLE)
         header_label.grid(row=0, column=0, pady=10)
         
         # Preview text
@@ -432,6 +528,17 @@ class RaffleManagerGUI:
                                      anchor='w')
         self.preview_label.grid(row=1, column=0, padx=20, pady=(0, 15), sticky="w")
         
+        # Preview line for each account type, given its count
+        self.preview_lines = {
+            'blank': lambda count: f"• {count} BLANK accounts",
+            'roster': lambda count: (f"• {count} ROSTER accounts "
+                                     f"({self._int_value('roster_entries')} entries each)"),
+            'mail': lambda count: (f"• {count} MAIL accounts "
+                                   f"({self._int_value('mail_entries')} entries each)"),
+            'mixed': lambda count: (f"• {count} MIXED accounts ({self._int_value('roster_entries')} roster + "
+                                    f"{self._int_value('mail_entries')} mail)")
+        }
+        
     def create_action_buttons(self, parent):
         """Create action buttons"""
         button_frame = tk.Frame(parent, bg=HackerTheme.BG_DARK)
@@ -463,7 +570,7 @@ class RaffleManagerGUI:
         
     def create_output_area(self, parent):
         """Create output/log area with fixed height"""
-        section_frame = tk.Frame(parent, bg=HackerTheme.BG_MEDIUM, relief='ridge', bd=1)
+        section_frame = tk.Frame(parent, **SECTION_FRAME_STYLE)
         section_frame.grid(row=7, column=0, sticky="ew", pady=(15, 0))
         section_frame.grid_rowconfigure(1, weight=0)  # Don't expand
         section_frame.grid_columnconfigure(0, weight=1)
@@ -471,9 +578,7 @@ class RaffleManagerGUI:
         # Section header
         header_label = tk.Label(section_frame,
                                text=">>> SYSTEM OUTPUT <<<",
-                               font=('Consolas', 12, 'bold'),
-                               fg=HackerTheme.FG_PRIMARY,
-                               bg=HackerTheme.BG_MEDIUM)
+                               **SECTION_HEADER_STYLE)
         header_label.grid(row=0, column=0, pady=10)
         
         # Output text area with scrollbar - FIXED HEIGHT
@@ -495,20 +600,21 @@ class RaffleManagerGUI:
         scrollbar.grid(row=0, column=1, sticky="ns")
         self.output_text.config(yscrollcommand=scrollbar.set)
         
+        # Configure color tags
+        self.output_text.tag_configure("error", foreground=HackerTheme.ERROR)
+        self.output_text.tag_configure("warning", foreground=HackerTheme.WARNING)
+        self.output_text.tag_configure("success", foreground=HackerTheme.SUCCESS)
+        self.output_text.tag_configure("info", foreground=HackerTheme.FG_PRIMARY)
+        
         # Initial message
         self.log_message("⚡ RaffleManager Data Generator initialized")
         self.log_message("📁 Ready to generate ESO addon test data...")
         self.log_message("💡 Tip: Use mouse wheel to scroll, Ctrl+G to generate")
         
         # Add keyboard shortcuts
-        self.root.bind('<Control-g>', lambda e: self.generate_data())
-        self.root.bind('<Control-r>', lambda e: self.reset_to_defaults())
-        self.root.bind('<F5>', lambda e: self.update_preview())
-        
-        # Make Enter key work in entry fields
-        for entry in [self.ticket_cost_var, self.roster_entries_var, self.mail_entries_var]:
-            # We'll bind this after the entry widgets are created
-            pass
+        self.root.bind('<Control-g>', self.generate_data)
+        self.root.bind('<Control-r>', self.reset_to_defaults)
+        self.root.bind('<F5>', self.update_preview)
         
     def load_settings(self):
         """Load settings from config into GUI"""
@@ -556,29 +662,15 @@ class RaffleManagerGUI:
         
         for account_type in ['blank', 'roster', 'mail', 'mixed']:
             account_types_enabled[account_type] = self.account_vars[account_type].get()
-            try:
-                account_counts[account_type] = int(self.count_vars[account_type].get() or "0")
-            except ValueError:
-                account_counts[account_type] = 0
+            account_counts[account_type] = self._int_value(account_type, fallback=0)
         
         # Update config
         self.config['account_types_enabled'] = account_types_enabled
         self.config['account_counts'] = account_counts
         
-        try:
-            self.config['default_ticket_cost'] = int(self.ticket_cost_var.get() or "1000")
-        except ValueError:
-            self.config['default_ticket_cost'] = 1000
-            
-        try:
-            self.config['roster_entries_per_account'] = int(self.roster_entries_var.get() or "10")
-        except ValueError:
-            self.config['roster_entries_per_account'] = 10
-            
-        try:
-            self.config['mail_entries_per_account'] = int(self.mail_entries_var.get() or "10")
-        except ValueError:
-            self.config['mail_entries_per_account'] = 10
+        self.config['default_ticket_cost'] = self._int_value('ticket_cost', fallback=1000)
+        self.config['roster_entries_per_account'] = self._int_value('roster_entries', fallback=10)
+        self.config['mail_entries_per_account'] = self._int_value('mail_entries', fallback=10)
         
         self.config['default_output_filename'] = self.filename_var.get() or 'RaffleManager_Generated.lua'
         self.config['output_folder'] = self.output_folder_var.get() or ''
@@ -599,7 +691,42 @@ class RaffleManagerGUI:
             }
         self.config['timestamp_config'] = timestamp_config
         
-        save_config(self.config)
+        self.queue_config_save()
+        
+    def queue_config_save(self):
+        """Write a snapshot of the config from the worker thread instead of blocking the GUI"""
+        with self._config_lock:
+            self._unsaved_config = copy.deepcopy(self.config)
+        # Queued before any generation job submitted after it, so the generator reads the new config
+        self._submit_job("save_config", self._flush_config)
+        
+    def _flush_config(self):
+        """Write the latest unsaved config snapshot, if any"""
+        # Only the swap is locked; the write happens outside, so queue_config_save never waits on disk
+        with self._config_lock:
+            config, self._unsaved_config = self._unsaved_config, None
+        if config is not None:
+            save_config(config)
+        
+    def _track_int(self, var: tk.StringVar, key: str, default: str):
+        """Keep int_values[key] parsed from var as it is edited"""
+        def on_write(*args):
+            try:
+                self.int_values[key] = int(var.get() or default)
+            except ValueError:
+                self.int_values[key] = None
+        
+        var.trace_add('write', on_write)
+        on_write()
+        
+    def _int_value(self, key: str, fallback=None) -> int:
+        """Return a parsed numeric field, or the fallback (ValueError without one) if it is invalid"""
+        value = self.int_values[key]
+        if value is not None:
+            return value
+        if fallback is not None:
+            return fallback
+        raise ValueError(f"{key.replace('_', ' ')} must be a whole number")
         
     def update_entry_state(self, account_type):
         """Update entry field state based on checkbox"""
@@ -611,35 +738,30 @@ class RaffleManagerGUI:
         else:
             entry.configure(state='disabled')
             
-    def update_preview(self):
+    def schedule_preview(self, event=None):
+        """Update the preview once a burst of keystrokes/clicks has settled"""
+        if self._preview_after_id is not None:
+            self.root.after_cancel(self._preview_after_id)
+        self._preview_after_id = self.root.after(150, self._run_preview)
+        
+    def _run_preview(self):
+        """Run the preview update scheduled by schedule_preview"""
+        self._preview_after_id = None
+        self.update_preview()
+        
+    def update_preview(self, event=None):
         """Update the generation preview"""
         try:
-            total_accounts = 0
-            account_details = []
-            
-            for account_type in ['blank', 'roster', 'mail', 'mixed']:
-                if self.account_vars[account_type].get():
-                    count = int(self.count_vars[account_type].get() or "0")
-                    if count > 0:
-                        total_accounts += count
-                        
-                        if account_type == 'roster':
-                            roster_entries = int(self.roster_entries_var.get() or "10")
-                            account_details.append(f"• {count} {account_type.upper()} accounts ({roster_entries} entries each)")
-                        elif account_type == 'mail':
-                            mail_entries = int(self.mail_entries_var.get() or "10")
-                            account_details.append(f"• {count} {account_type.upper()} accounts ({mail_entries} entries each)")
-                        elif account_type == 'mixed':
-                            roster_entries = int(self.roster_entries_var.get() or "10")
-                            mail_entries = int(self.mail_entries_var.get() or "10")
-                            account_details.append(f"• {count} {account_type.upper()} accounts ({roster_entries} roster + {mail_entries} mail)")
-                        else:
-                            account_details.append(f"• {count} {account_type.upper()} accounts")
-                
-                # Update entry state
+            for account_type in self.account_vars:
                 self.update_entry_state(account_type)
             
-            ticket_cost = int(self.ticket_cost_var.get() or "1000")
+            counts = [(account_type, self._int_value(account_type))
+                      for account_type, enabled in self.account_vars.items() if enabled.get()]
+            counts = [(account_type, count) for account_type, count in counts if count > 0]
+            total_accounts = sum(count for _, count in counts)
+            account_details = [self.preview_lines[account_type](count) for account_type, count in counts]
+            
+            ticket_cost = self._int_value('ticket_cost')
             filename = self.filename_var.get() or "RaffleManager_Generated.lua"
             
             preview_text = f"TOTAL: {total_accounts} accounts | TICKET_COST: {ticket_cost}\n"
@@ -676,47 +798,59 @@ class RaffleManagerGUI:
     def log_message(self, message: str, level: str = "info"):
         """Add a message to the output log"""
         timestamp = time.strftime("%H:%M:%S")
-        
-        if level == "error":
-            color_tag = "error"
-            prefix = "❌"
-        elif level == "warning":
-            color_tag = "warning"
-            prefix = "⚠️"
-        elif level == "success":
-            color_tag = "success"
-            prefix = "✅"
-        else:
-            color_tag = "info"
-            prefix = "ℹ️"
-            
+        color_tag, prefix = _LEVEL_META.get(level, _LEVEL_META["info"])
         formatted_message = f"[{timestamp}] {prefix} {message}\n"
         
-        # Configure color tags
-        self.output_text.tag_configure("error", foreground=HackerTheme.ERROR)
-        self.output_text.tag_configure("warning", foreground=HackerTheme.WARNING)
-        self.output_text.tag_configure("success", foreground=HackerTheme.SUCCESS)
-        self.output_text.tag_configure("info", foreground=HackerTheme.FG_PRIMARY)
+        # Lines logged in one burst (like the startup messages) are inserted together
+        self._log_pending.append((formatted_message, color_tag))
+        if len(self._log_pending) == 1:
+            self.root.after_idle(self._flush_log)
+        
+    def _post_log(self, message: str, level: str = "info"):
+        """Queue a message for the output log (safe to call from the worker thread)"""
+        self._log_q.put((message, level))
+        
+    def _drain_log(self):
+        """Log the messages posted by the worker thread since the last drain"""
+        # The saved config comes back this way too, so the worker never calls into Tk
+        try:
+            self._apply_loaded_config(self._config_q.get_nowait())
+        except queue.Empty:
+            pass
         
-        # Insert message
-        self.output_text.insert(tk.END, formatted_message, color_tag)
+        while True:
+            try:
+                message, level = self._log_q.get_nowait()
+            except queue.Empty:
+                break
+            self.log_message(message, level)
+        self.root.after(LOG_DRAIN_MS, self._drain_log)
+        
+    def _flush_log(self):
+        """Insert the pending log lines in one call and scroll to the end"""
+        chunks = [part for line in self._log_pending for part in line]
+        self._log_pending.clear()
+        self.output_text.insert(tk.END, *chunks)
         self.output_text.see(tk.END)
-        self.root.update_idletasks()
         
-    def generate_data(self):
+    def generate_data(self, event=None):
         """Generate the data file"""
+        # <Return> in the settings entries bypasses the disabled button, so check it here
+        if str(self.generate_btn['state']) == 'disabled':
+            return
+        
         try:
             self.save_settings()
             
             # Get parameters
-            blank_count = int(self.count_vars['blank'].get() or "0") if self.account_vars['blank'].get() else 0
-            roster_count = int(self.count_vars['roster'].get() or "0") if self.account_vars['roster'].get() else 0
-            mail_count = int(self.count_vars['mail'].get() or "0") if self.account_vars['mail'].get() else 0
-            mixed_count = int(self.count_vars['mixed'].get() or "0") if self.account_vars['mixed'].get() else 0
-            
-            ticket_cost = int(self.ticket_cost_var.get() or "1000")
-            roster_entries = int(self.roster_entries_var.get() or "10")
-            mail_entries = int(self.mail_entries_var.get() or "10")
+            blank_count = self._int_value('blank') if self.account_vars['blank'].get() else 0
+            roster_count = self._int_value('roster') if self.account_vars['roster'].get() else 0
+            mail_count = self._int_value('mail') if self.account_vars['mail'].get() else 0
+            mixed_count = self._int_value('mixed') if self.account_vars['mixed'].get() else 0
+            
+            ticket_cost = self._int_value('ticket_cost')
+            roster_entries = self._int_value('roster_entries')
+            mail_entries = self._int_value('mail_entries')
             filename = self.filename_var.get() or "RaffleManager_Generated.lua"
             
             if blank_count + roster_count + mail_count + mixed_count == 0:
@@ -726,7 +860,7 @@ class RaffleManagerGUI:
             self.log_message(f"Starting generation of {filename}...")
             self.generate_btn.configure(state='disabled', text="⚡ GENERATING...")
             
-            # Run generation in thread to prevent GUI freeze
+            # Run generation on the worker thread to prevent GUI freeze
             def generate_thread():
                 try:
                     # Build command
@@ -749,25 +883,28 @@ class RaffleManagerGUI:
                     
                     if result.returncode == 0:
                         total_accounts = blank_count + roster_count + mail_count + mixed_count
-                        self.root.after(0, lambda: self.log_message(
-                            f"Successfully generated {filename} with {total_accounts} accounts", "success"))
+                        ok, message = True, f"Successfully generated {filename} with {total_accounts} accounts"
                     else:
-                        self.root.after(0, lambda: self.log_message(
-                            f"Generation failed: {result.stderr}", "error"))
+                        ok, message = False, f"Generation failed: {result.stderr}"
                     
                 except Exception as e:
-                    self.root.after(0, lambda: self.log_message(f"Generation failed: {str(e)}", "error"))
-                finally:
-                    self.root.after(0, lambda: self.generate_btn.configure(
-                        state='normal', text="⚡ GENERATE DATA ⚡"))
+                    ok, message = False, f"Generation failed: {str(e)}"
+                
+                # Report the result and re-enable the button in one callback on the Tk thread
+                self.root.after(0, self._on_generate_done, ok, message)
             
-            threading.Thread(target=generate_thread, daemon=True).start()
+            self._submit_job("generate", generate_thread)
             
         except ValueError as e:
             self.log_message(f"Invalid input: {str(e)}", "error")
         except Exception as e:
             self.log_message(f"Error: {str(e)}", "error")
             
+    def _on_generate_done(self, ok: bool, message: str):
+        """Log a finished generation and re-enable the generate button"""
+        self.log_message(message, "success" if ok else "error")
+        self.generate_btn.configure(state='normal', text="⚡ GENERATE DATA ⚡")
+        
     def validate_last_file(self):
         """Validate the last generated file"""
         # Find the most recently generated file
@@ -777,64 +914,75 @@ class RaffleManagerGUI:
             self.log_message("No generated files found to validate", "error")
             return
             
-        if not os.path.exists(filename):
+        try:
+            stat = os.stat(filename)
+        except OSError:
             self.log_message(f"File {filename} not found", "error")
             return
+        
+        # An unchanged file gives the same results, so show the previous ones again
+        fingerprint = (filename, stat.st_mtime_ns, stat.st_size)
+        if self._last_validation and self._last_validation[0] == fingerprint:
+            self.log_message(f"{filename} is unchanged since it was last validated")
+            for message, level in self._last_validation[1]:
+                self.log_message(message, level)
+            return
             
         self.log_message(f"Validating {filename}...")
         
         try:
-            # Run validation scripts
+            # Run the validators on the worker thread
             def validate_thread():
+                results = []
+                
+                def post(message, level):
+                    results.append((message, level))
+                    self._post_log(message, level)
+                
                 try:
-                    # Validate roster data
-                    result = subprocess.run([sys.executable, "validate.py", filename], 
-                                          capture_output=True, text=True, encoding='utf-8')
-                    if result.returncode == 0:
-                        self.root.after(0, lambda: self.log_message("Roster validation passed", "success"))
-                        if result.stdout.strip():
-                            self.root.after(0, lambda: self.log_message(result.stdout.strip(), "info"))
+                    # Validate roster data in-process instead of starting another interpreter
+                    ok, output = _run_captured(validate_roster_data, filename)
+                    if ok:
+                        post("Roster validation passed", "success")
+                        if output:
+                            post(output, "info")
                     else:
-                        error_msg = result.stderr.strip() if result.stderr else "Unknown validation error"
-                        self.root.after(0, lambda: self.log_message(f"Roster validation failed: {error_msg}", "error"))
+                        error_msg = output or "Unknown validation error"
+                        post(f"Roster validation failed: {error_msg}", "error")
                     
                     # Check mail amounts if applicable
-                    if os.path.exists("check_amounts.py"):
-                        result = subprocess.run([sys.executable, "check_amounts.py", filename], 
-                                              capture_output=True, text=True, encoding='utf-8')
-                        if result.returncode == 0:
-                            self.root.after(0, lambda: self.log_message("Mail amount validation passed", "success"))
-                            if result.stdout.strip():
+                    if check_amounts is not None:
+                        try:
+                            _, output = _run_captured(check_amounts, filename)
+                        except Exception as e:
+                            error_msg = str(e) or "Unknown validation error"
+                            post(f"Mail validation failed: {error_msg}", "error")
+                        else:
+                            post("Mail amount validation passed", "success")
+                            if output:
                                 # Log the amount validation details
-                                lines = result.stdout.strip().split('\n')
+                                lines = output.split('\n', 3)  # maxsplit: the rest stays unsplit
                                 for line in lines[:3]:  # Show first 3 lines of output
-                                    self.root.after(0, lambda l=line: self.log_message(l, "info"))
-                        else:
-                            error_msg = result.stderr.strip() if result.stderr else "Unknown validation error"
-                            self.root.after(0, lambda: self.log_message(f"Mail validation failed: {error_msg}", "error"))
-                            
+                                    post(line, "info")
+                    
+                    self._last_validation = (fingerprint, results)
+                    
                 except Exception as e:
-                    self.root.after(0, lambda: self.log_message(f"Validation error: {str(e)}", "error"))
+                    self._post_log(f"Validation error: {str(e)}", "error")
             
-            threading.Thread(target=validate_thread, daemon=True).start()
+            self._submit_job("validate", validate_thread)
             
         except Exception as e:
             self.log_message(f"Validation error: {str(e)}", "error")
             
-    def reset_to_defaults(self):
+    def reset_to_defaults(self, event=None):
         """Reset all settings to defaults"""
         result = messagebox.askyesno("Reset Settings", 
                                     "Reset all settings to program defaults?\n\nThis cannot be undone.")
         if result:
-            # Update config with defaults
-            self.config.update(DEFAULT_CONFIG)
-            self.config['account_types_enabled'] = {
-                'blank': True, 'roster': True, 'mail': True, 'mixed': True
-            }
-            self.config['account_counts'] = {
-                'blank': 5, 'roster': 10, 'mail': 15, 'mixed': 20
-            }
-            save_config(self.config)
+            # Update config with defaults (a fresh copy, so later edits can't leak into them)
+            self.config.update(copy.deepcopy(_FACTORY_DEFAULTS))
+            self.queue_config_save()
             
             # Reload GUI
             self.load_settings()
@@ -843,6 +991,9 @@ class RaffleManagerGUI:
     def run(self):
         """Start the GUI application"""
         self.root.mainloop()
+        
+        # The worker is a daemon thread, make sure the last settings reach the disk
+        self._flush_config()
 
 if __name__ == "__main__":
     app = RaffleManagerGUI()
@@ -3,55 +3,111 @@
 Validate RaffleManager .lua files for logical consistency
 """
 
+import itertools
+import operator
 import re
 import sys
 import io
 
-# Fix Windows console encoding issues
-if sys.platform == "win32":
-    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
-    sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8')
+# Roster entries are recognized by their four sales/purchases fields, in any order.
+# The file is scanned as bytes: the keys are ASCII, so nothing needs decoding.
+ROSTER_KEYS = (b'sales10', b'purchases30', b'sales30', b'purchases10')
+ROSTER_FIELD_RE = re.compile(rb'\["(%s)"\]\s*=\s*(\d+)' % b'|'.join(ROSTER_KEYS))
+SALES10_KEY = b'["sales10"]'
+MAX_REPORTED_ISSUES = 10
+READ_BLOCK_SIZE = 1 << 20  # 1 MB
+
+_roster_values = operator.itemgetter(*ROSTER_KEYS)
+
+def _iter_blocks(f):
+    """Yield the file in blocks that end just after a closing brace, so no table is split"""
+    carry = b""
+    while True:
+        block = f.read(READ_BLOCK_SIZE)
+        if not block:
+            if carry:
+                yield carry
+            return
+        block = carry + block
+        cut = block.rfind(b"}") + 1
+        carry = block[cut:]
+        if cut:
+            yield block[:cut]
+
+def _iter_key_positions(block):
+    """Yield the offset of every sales10 key in block"""
+    i = block.find(SALES10_KEY)
+    while i >= 0:
+        yield i
+        i = block.find(SALES10_KEY, i + len(SALES10_KEY))
+
+def _iter_roster_entries(blocks):
+    """Yield (sales10, purchases30, sales30, purchases10) for each table that has all four fields"""
+    for block in blocks:
+        # Only tables holding a sales10 key are looked at; the fields are read from the
+        # innermost table around it, whatever order they were written in
+        open_before = block.rfind
+        close_after = block.find
+        for i in _iter_key_positions(block):
+            start = open_before(b"{", 0, i) + 1
+            end = close_after(b"}", i)
+            fields = dict(ROSTER_FIELD_RE.findall(block, start, end if end >= 0 else len(block)))
+            if len(fields) == len(ROSTER_KEYS):
+                yield tuple(map(int, _roster_values(fields)))
+
+def _format_issues(bad):
+    """Yield a message for each inconsistency in the given (index, entry) pairs"""
+    for i, (sales10, purchases30, sales30, purchases10) in bad:
+        # Check sales consistency
+        if sales10 > sales30:
+            yield f"Entry {i+1}: sales10 ({sales10}) > sales30 ({sales30})"
+        
+        # Check purchases consistency
+        if purchases10 > purchases30:
+            yield f"Entry {i+1}: purchases10 ({purchases10}) > purchases30 ({purchases30})"
 
 def validate_roster_data(filename):
     """Validate that roster data has consistent 10-day vs 30-day values"""
     print(f"Validating {filename}...")
     
-    with open(filename, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
-    # Find all roster entries
-    roster_pattern = r'\["sales10"\]\s*=\s*(\d+),.*?\["purchases30"\]\s*=\s*(\d+),.*?\["sales30"\]\s*=\s*(\d+),.*?\["purchases10"\]\s*=\s*(\d+)'
-    matches = re.findall(roster_pattern, content, re.DOTALL)
-    
-    issues = []
     total_entries = 0
+    issue_count = 0
+    bad = []  # The first inconsistent (index, entry) pairs, enough to fill the report
     
-    for i, match in enumerate(matches):
-        sales10, purchases30, sales30, purchases10 = map(int, match)
-        total_entries += 1
-        
-        # Check sales consistency
-        if sales10 > sales30:
-            issues.append(f"Entry {i+1}: sales10 ({sales10}) > sales30 ({sales30})")
-        
-        # Check purchases consistency  
-        if purchases10 > purchases30:
-            issues.append(f"Entry {i+1}: purchases10 ({purchases10}) > purchases30 ({purchases30})")
+    # Stream the file in blocks instead of reading it into memory
+    with open(filename, 'rb') as f:
+        for i, entry in enumerate(_iter_roster_entries(_iter_blocks(f))):
+            total_entries += 1
+            sales10, purchases30, sales30, purchases10 = entry
+            
+            # Fast path: nothing is formatted here, only counted
+            problems = (sales10 > sales30) + (purchases10 > purchases30)
+            if problems:
+                issue_count += problems
+                if len(bad) < MAX_REPORTED_ISSUES:
+                    bad.append((i, entry))
+    
+    issues = list(itertools.islice(_format_issues(bad), MAX_REPORTED_ISSUES))
     
     print(f"Validated {total_entries} roster entries")
     
     if issues:
-        print(f"Found {len(issues)} logical inconsistencies:")
-        for issue in issues[:10]:  # Show first 10 issues
+        print(f"Found {issue_count} logical inconsistencies:")
+        for issue in issues:  # Only the first MAX_REPORTED_ISSUES are kept
             print(f"  - {issue}")
-        if len(issues) > 10:
-            print(f"  ... and {len(issues) - 10} more")
+        if issue_count > len(issues):
+            print(f"  ... and {issue_count - len(issues)} more")
         return False
     else:
         print("[SUCCESS] All entries are logically consistent!")
         return True
 
 if __name__ == "__main__":
+    # Fix Windows console encoding issues (only when run as a script, the GUI imports this module)
+    if sys.platform == "win32":
+        sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+        sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8')
+    
     if len(sys.argv) != 2:
         print("Usage: python validate.py <filename.lua>")
         sys.exit(1)